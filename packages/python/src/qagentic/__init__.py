@@ -19,39 +19,55 @@ Usage:
     qagentic.attach("screenshot.png", "Login Screenshot")
 """
 
-from qagentic.core.config import configure, get_config, QAgenticConfig
-from qagentic.core.decorators import (
-    feature,
-    story,
-    epic,
-    severity,
-    tag,
-    label,
-    link,
-    issue,
-    testcase,
-    description,
-    title,
-    owner,
-    layer,
-    parent_suite,
-    suite,
-    sub_suite,
-)
-from qagentic.core.context import step, Step
-from qagentic.core.attachments import (
-    attach,
-    attach_file,
-    attach_screenshot,
-    attach_json,
-    attach_text,
-    attach_html,
-    attach_video,
-)
-from qagentic.core.severity import Severity
-from qagentic.core.status import Status
-from qagentic.core.reporter import QAgenticReporter, get_reporter
-from qagentic.core.test_result import TestResult, StepResult
+import importlib
+from typing import Any, List
+
+# Public names resolved lazily (PEP 562) so ``import qagentic`` stays cheap;
+# each submodule is imported on first attribute access.
+_LAZY = {
+    # Configuration
+    "configure": "qagentic.core.config",
+    "get_config": "qagentic.core.config",
+    "reset_config": "qagentic.core.config",
+    "QAgenticConfig": "qagentic.core.config",
+    # Decorators
+    "feature": "qagentic.core.decorators",
+    "story": "qagentic.core.decorators",
+    "epic": "qagentic.core.decorators",
+    "severity": "qagentic.core.decorators",
+    "tag": "qagentic.core.decorators",
+    "label": "qagentic.core.decorators",
+    "link": "qagentic.core.decorators",
+    "issue": "qagentic.core.decorators",
+    "testcase": "qagentic.core.decorators",
+    "description": "qagentic.core.decorators",
+    "title": "qagentic.core.decorators",
+    "owner": "qagentic.core.decorators",
+    "layer": "qagentic.core.decorators",
+    "parent_suite": "qagentic.core.decorators",
+    "suite": "qagentic.core.decorators",
+    "sub_suite": "qagentic.core.decorators",
+    # Context managers
+    "step": "qagentic.core.context",
+    "Step": "qagentic.core.context",
+    # Attachments
+    "attach": "qagentic.core.attachments",
+    "attach_file": "qagentic.core.attachments",
+    "attach_screenshot": "qagentic.core.attachments",
+    "attach_json": "qagentic.core.attachments",
+    "attach_text": "qagentic.core.attachments",
+    "attach_html": "qagentic.core.attachments",
+    "attach_video": "qagentic.core.attachments",
+    # Enums
+    "Severity": "qagentic.core.severity",
+    "Status": "qagentic.core.status",
+    # Reporter
+    "QAgenticReporter": "qagentic.core.reporter",
+    "get_reporter": "qagentic.core.reporter",
+    # Models
+    "TestResult": "qagentic.core.test_result",
+    "StepResult": "qagentic.core.test_result",
+}
 
 __version__ = "0.1.0"
 __author__ = "QAagentic Team"
@@ -61,6 +77,7 @@ __all__ = [
     # Configuration
     "configure",
     "get_config",
+    "reset_config",
     "QAgenticConfig",
     # Decorators
     "feature",
@@ -102,3 +119,18 @@ __all__ = [
     # Version
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return list(__all__)
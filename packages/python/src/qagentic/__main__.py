@@ -0,0 +1,11 @@
+"""Entry point for the ``qagentic`` console script and ``python -m qagentic``."""
+
+
+def main() -> None:
+    """Run the QAagentic CLI."""
+    from qagentic.cli import _build_cli
+    _build_cli()()
+
+
+if __name__ == "__main__":
+    main()
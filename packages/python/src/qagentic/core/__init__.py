@@ -1,14 +1,34 @@
 """Core module for QAagentic SDK."""
 
-from qagentic.core.config import configure, get_config, QAgenticConfig
-from qagentic.core.decorators import feature, story, epic, severity, tag, label
-from qagentic.core.context import step, Step
-from qagentic.core.severity import Severity
-from qagentic.core.status import Status
+import importlib
+from typing import Any, List
+
+# ``severity`` shares its name with the ``qagentic.core.severity`` submodule, so
+# it must be bound eagerly: once the submodule is imported the package attribute
+# would shadow ``__getattr__``. decorators.py only pulls in the enums.
+from qagentic.core.decorators import severity
+
+# Everything else is resolved lazily on first access, mirroring the top-level package.
+_LAZY = {
+    "configure": "qagentic.core.config",
+    "get_config": "qagentic.core.config",
+    "reset_config": "qagentic.core.config",
+    "QAgenticConfig": "qagentic.core.config",
+    "feature": "qagentic.core.decorators",
+    "story": "qagentic.core.decorators",
+    "epic": "qagentic.core.decorators",
+    "tag": "qagentic.core.decorators",
+    "label": "qagentic.core.decorators",
+    "step": "qagentic.core.context",
+    "Step": "qagentic.core.context",
+    "Severity": "qagentic.core.severity",
+    "Status": "qagentic.core.status",
+}
 
 __all__ = [
     "configure",
     "get_config",
+    "reset_config",
     "QAgenticConfig",
     "feature",
     "story",
@@ -21,3 +41,18 @@ __all__ = [
     "Severity",
     "Status",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return list(__all__)
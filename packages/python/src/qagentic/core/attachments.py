@@ -8,30 +8,156 @@ Usage:
 """
 
 import base64
-import json
-import mimetypes
+import functools
+import hashlib
+import os
+import stat
+import time
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional, Union
-from uuid import uuid4
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from qagentic.core.context import _get_current_step
+from qagentic.core.serialization import dumps
 
-# Global attachment storage for current test
-import threading
-_attachment_storage = threading.local()
+# Attachments for the current test. A ContextVar (rather than threading.local)
+# is a single C-level lookup and is also safe under asyncio.
+_ATTACHMENTS: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar(
+    "_qagentic_attachments", default=None
+)
 
 
-def _get_attachments() -> list:
+def _get_attachments() -> List[Dict[str, Any]]:
     """Get current test attachments."""
-    if not hasattr(_attachment_storage, "attachments"):
-        _attachment_storage.attachments = []
-    return _attachment_storage.attachments
+    attachments = _ATTACHMENTS.get()
+    if attachments is None:
+        attachments = []
+        _ATTACHMENTS.set(attachments)
+    return attachments
+
+
+def _take_attachments() -> Optional[List[Dict[str, Any]]]:
+    """
+    Hand over the current test's attachments and start a fresh list.
+    
+    Returns None, without allocating a new list, if nothing was attached.
+    """
+    attachments = _ATTACHMENTS.get()
+    if not attachments:
+        return None
+    _ATTACHMENTS.set([])
+    return attachments
 
 
 def _clear_attachments() -> None:
     """Clear attachments for new test."""
-    _attachment_storage.attachments = []
+    attachments = _ATTACHMENTS.get()
+    if attachments is None:
+        _ATTACHMENTS.set([])
+    else:
+        # Truncate in place; reported lists were already handed over by
+        # _take_attachments, so nothing that is kept gets emptied here.
+        attachments.clear()
+
+
+# Strings this long (or containing newlines/NULs) are content, never paths.
+_PATH_MAX = 4096
+
+
+def _regular_file_stat(data: Union[str, Path]) -> Optional[os.stat_result]:
+    """Stat ``data`` with a single syscall if it names a regular file."""
+    candidate = os.fspath(data)
+    if len(candidate) >= _PATH_MAX or "\n" in candidate or "\x00" in candidate:
+        return None
+    try:
+        st = os.stat(candidate)
+    except (OSError, ValueError):
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
+@functools.lru_cache(maxsize=256)
+def _guess_mime(suffix: str) -> Optional[str]:
+    """Guess a MIME type from a lower-cased file suffix (cached per suffix)."""
+    # Imported on first use: mimetypes loads the system type database lazily,
+    # and most runs never attach a file.
+    import mimetypes
+    return mimetypes.guess_type("x" + suffix)[0]
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the last formatted second. Swapped
+# as one tuple so concurrent readers never see a mismatched pair.
+_ISO_SECOND: Tuple[int, str] = (-1, "")
+
+
+def _iso_now() -> str:
+    """
+    Current UTC time, formatted like ``datetime.now(timezone.utc).isoformat()``.
+    
+    The date/time part only changes once per second, so it is formatted once
+    and reused; only the microseconds are rendered per call.
+    """
+    global _ISO_SECOND
+    sec, usec = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_sec, prefix = _ISO_SECOND
+    if sec != cached_sec:
+        prefix = datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _ISO_SECOND = (sec, prefix)
+    if usec:
+        return f"{prefix}.{usec:06d}+00:00"
+    return f"{prefix}+00:00"
+
+
+# Files up to this size are read into memory by attach(); larger ones are
+# kept as a path + sha256 reference and read at report time.
+_INLINE_FILE_MAX = 4 * 1024 * 1024
+
+
+def _file_sha256(path: Path) -> str:
+    """Hash a file in chunks without loading it into memory."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def _serialize_attachment(attachment: Any) -> Any:
+    """
+    Return a JSON-ready copy of an attachment with base64 ``content``.
+    
+    attach() keeps raw bytes (or only a reference for large files) while the
+    test runs; encoding is deferred to here so it happens once, at report
+    time. A referenced file is only embedded if it still matches its recorded
+    sha256; otherwise ``content`` is None and ``content_error`` says whether
+    the file is ``"missing"`` or was ``"modified"`` after it was attached.
+    Step attachments (objects with ``to_dict``) are converted to plain dicts.
+    """
+    if not isinstance(attachment, dict):
+        to_dict = getattr(attachment, "to_dict", None)
+        return to_dict() if to_dict is not None else attachment
+    if "content_bytes" in attachment:
+        data = dict(attachment)
+        data["content"] = base64.b64encode(data.pop("content_bytes")).decode("ascii")
+        return data
+    if "path" in attachment and "sha256" in attachment:
+        data = dict(attachment)
+        data["content"] = None
+        try:
+            with open(data["path"], "rb") as f:
+                raw = f.read()
+        except OSError:
+            data["content_error"] = "missing"
+            return data
+        if hashlib.sha256(raw).hexdigest() != data["sha256"]:
+            data["content_error"] = "modified"
+            return data
+        data["content"] = base64.b64encode(raw).decode("ascii")
+        return data
+    return attachment
 
 
 def attach(
@@ -57,21 +183,22 @@ def attach(
         qagentic.attach(b"binary data", "Raw Data", "application/octet-stream")
         qagentic.attach('{"key": "value"}', "JSON", "application/json")
     """
-    attachment_id = str(uuid4())
+    attachment_id = os.urandom(16).hex()
+    file_path: Optional[Path] = None
     
     # Handle file path
     if isinstance(data, (str, Path)):
-        path = Path(data)
-        if path.exists() and path.is_file():
-            with open(path, "rb") as f:
-                content = f.read()
+        st = _regular_file_stat(data)
+        if st is not None:
+            path = Path(data)
+            file_path = path.resolve()
             if not attachment_type:
-                attachment_type = mimetypes.guess_type(str(path))[0] or "application/octet-stream"
+                attachment_type = _guess_mime(path.suffix.lower()) or "application/octet-stream"
             if not extension:
                 extension = path.suffix.lstrip(".")
         else:
             # Treat as string content
-            content = data.encode() if isinstance(data, str) else data
+            content = str(data).encode()
             if not attachment_type:
                 attachment_type = "text/plain"
     elif isinstance(data, bytes):
@@ -83,15 +210,29 @@ def attach(
         if not attachment_type:
             attachment_type = "text/plain"
     
-    attachment = {
+    attachment: Dict[str, Any] = {
         "id": attachment_id,
         "name": name,
         "type": attachment_type,
         "extension": extension,
-        "content": base64.b64encode(content).decode() if isinstance(content, bytes) else content,
-        "size": len(content),
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _iso_now(),
     }
+    if file_path is not None and st.st_size <= _INLINE_FILE_MAX:
+        # Small files are read now, so a test that later overwrites the same
+        # path (e.g. "screenshot.png") cannot change what was attached here.
+        content = file_path.read_bytes()
+        attachment["path"] = str(file_path)
+        attachment["content_bytes"] = content
+        attachment["size"] = len(content)
+    elif file_path is not None:
+        # Keep only a reference; the file is read (and checked against the
+        # hash) when the report is written.
+        attachment["path"] = str(file_path)
+        attachment["size"] = st.st_size
+        attachment["sha256"] = _file_sha256(file_path)
+    else:
+        attachment["content_bytes"] = content
+        attachment["size"] = len(content)
     
     # Add to current step if in step context
     current_step = _get_current_step()
@@ -167,8 +308,8 @@ def attach_json(
     Example:
         qagentic.attach_json({"status": "success", "data": [1, 2, 3]}, "API Response")
     """
-    json_str = json.dumps(data, indent=indent, default=str)
-    return attach(json_str, name, "application/json", "json")
+    # Bytes go straight into attach(), skipping a str round-trip.
+    return attach(dumps(data, indent=indent, default=str), name, "application/json", "json")
 
 
 def attach_text(
@@ -229,7 +370,7 @@ def attach_video(
         qagentic.attach_video("recordings/test.mp4", "Test Recording")
     """
     path = Path(path)
-    mime_type = mimetypes.guess_type(str(path))[0] or "video/mp4"
+    mime_type = _guess_mime(path.suffix.lower()) or "video/mp4"
     return attach(path, name, mime_type)
 
 
@@ -0,0 +1,8 @@
+"""Helpers for supporting the full range of Python versions (3.8+)."""
+
+import sys
+from typing import Any, Dict
+
+# Keyword arguments enabling ``__slots__`` on dataclasses. ``slots=True`` is
+# only understood by Python 3.10+; older interpreters keep ``__dict__``.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
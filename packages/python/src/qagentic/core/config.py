@@ -1,13 +1,47 @@
 """Configuration management for QAagentic SDK."""
 
+import copy
 import os
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-import yaml
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+from qagentic.core.compat import DATACLASS_SLOTS
+from qagentic.core.serialization import dumps
 
-@dataclass
+
+_TRUTHY = frozenset(("true", "1", "yes", "on"))
+
+
+def _env_bool(value: str) -> bool:
+    return value.lower() in _TRUTHY
+
+
+# Environment overrides applied by QAgenticConfig.from_env:
+# (variable, config section or None for top-level, attribute, converter)
+_ENV_MAP: Tuple[Tuple[str, Optional[str], str, Callable[[str], Any]], ...] = (
+    # Project settings
+    ("QAGENTIC_PROJECT_NAME", None, "project_name", str),
+    ("QAGENTIC_ENVIRONMENT", None, "environment", str),
+    # API settings
+    ("QAGENTIC_API_ENABLED", "api", "enabled", _env_bool),
+    ("QAGENTIC_API_URL", "api", "url", str),
+    ("QAGENTIC_API_KEY", "api", "key", str),
+    # Local settings
+    ("QAGENTIC_LOCAL_ENABLED", "local", "enabled", _env_bool),
+    ("QAGENTIC_OUTPUT_DIR", "local", "output_dir", str),
+    # Feature flags
+    ("QAGENTIC_AI_ANALYSIS", "features", "ai_analysis", _env_bool),
+    ("QAGENTIC_SCREENSHOTS", "features", "screenshots", str),
+    ("QAGENTIC_VIDEOS", "features", "videos", str),
+    # Labels
+    ("QAGENTIC_TEAM", "labels", "team", str),
+    ("QAGENTIC_COMPONENT", "labels", "component", str),
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class APIConfig:
     """API reporting configuration."""
     
@@ -30,7 +64,7 @@ class APIConfig:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LocalConfig:
     """Local file reporting configuration."""
     
@@ -49,7 +83,7 @@ class LocalConfig:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FeaturesConfig:
     """Feature flags configuration."""
     
@@ -74,7 +108,7 @@ class FeaturesConfig:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LabelsConfig:
     """Default labels for all tests."""
     
@@ -93,7 +127,7 @@ class LabelsConfig:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class QAgenticConfig:
     """Main configuration for QAagentic SDK."""
     
@@ -117,54 +151,74 @@ class QAgenticConfig:
     
     def __str__(self) -> str:
         """String representation for serialization."""
-        import json
-        return json.dumps(self.to_dict())
+        return dumps(self.to_dict()).decode("utf-8")
     
     def encode(self, encoding: str = "utf-8") -> bytes:
         """Encode configuration to bytes for serialization."""
-        return str(self).encode(encoding)
+        if encoding.replace("-", "").replace("_", "").lower() == "utf8":
+            return dumps(self.to_dict())
+        # Other codecs get ASCII-escaped JSON so any character survives encoding.
+        import json
+        return json.dumps(self.to_dict()).encode(encoding)
     
     @classmethod
     def from_env(cls) -> "QAgenticConfig":
         """Create configuration from environment variables."""
         config = cls()
+        get = os.environ.get
         
-        # Project settings
-        config.project_name = os.getenv("QAGENTIC_PROJECT_NAME", config.project_name)
-        config.environment = os.getenv("QAGENTIC_ENVIRONMENT", config.environment)
-        
-        # API settings
-        config.api.enabled = os.getenv("QAGENTIC_API_ENABLED", "true").lower() == "true"
-        config.api.url = os.getenv("QAGENTIC_API_URL", config.api.url)
-        config.api.key = os.getenv("QAGENTIC_API_KEY", config.api.key)
+        for var, section, attr, convert in _ENV_MAP:
+            value = get(var)
+            if value is not None:
+                setattr(getattr(config, section) if section else config, attr, convert(value))
         
-        # Local settings
-        config.local.enabled = os.getenv("QAGENTIC_LOCAL_ENABLED", "true").lower() == "true"
-        config.local.output_dir = os.getenv("QAGENTIC_OUTPUT_DIR", config.local.output_dir)
-        formats = os.getenv("QAGENTIC_OUTPUT_FORMAT")
+        formats = get("QAGENTIC_OUTPUT_FORMAT")
         if formats:
             config.local.formats = [f.strip() for f in formats.split(",")]
         
-        # Feature flags
-        config.features.ai_analysis = os.getenv("QAGENTIC_AI_ANALYSIS", "true").lower() == "true"
-        config.features.screenshots = os.getenv("QAGENTIC_SCREENSHOTS", config.features.screenshots)
-        config.features.videos = os.getenv("QAGENTIC_VIDEOS", config.features.videos)
-        
-        # Labels
-        config.labels.team = os.getenv("QAGENTIC_TEAM", config.labels.team)
-        config.labels.component = os.getenv("QAGENTIC_COMPONENT", config.labels.component)
-        
         return config
     
     @classmethod
     def from_file(cls, path: Union[str, Path]) -> "QAgenticConfig":
         """Load configuration from YAML file."""
         path = Path(path)
-        if not path.exists():
+        try:
+            st = path.stat()
+        except OSError:
             return cls.from_env()
         
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+        # Re-parse only when the file changed since the last load.
+        key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+        parsed = _PARSED_CACHE.get(key)
+        if parsed is None:
+            parsed = cls._parse_file(path)
+            _PARSED_CACHE[key] = parsed
+            if len(_PARSED_CACHE) > _PARSED_CACHE_SIZE:
+                _PARSED_CACHE.popitem(last=False)
+        else:
+            _PARSED_CACHE.move_to_end(key)
+        # Callers mutate their config (e.g. configure()), so never hand out the cached one.
+        config = copy.deepcopy(parsed)
+        
+        # Override with environment variables
+        get = os.environ.get
+        if (api_url := get("QAGENTIC_API_URL")):
+            config.api.url = api_url
+        if (api_key := get("QAGENTIC_API_KEY")):
+            config.api.key = api_key
+        
+        return config
+    
+    @classmethod
+    def _parse_file(cls, path: Path) -> "QAgenticConfig":
+        """Parse a YAML config file, without environment overrides."""
+        # Imported here so env/kwargs-only setups never pay for PyYAML.
+        from yaml import load
+        
+        Loader = _yaml_loader()
+        # Bytes let libyaml detect the encoding itself, skipping Python-level decoding.
+        with open(path, "rb") as f:
+            data = load(f, Loader=Loader) or {}
         
         config = cls()
         
@@ -200,33 +254,161 @@ class QAgenticConfig:
         config.labels.component = labels.get("component", config.labels.component)
         config.labels.custom = {k: v for k, v in labels.items() if k not in ("team", "component")}
         
-        # Override with environment variables
-        env_config = cls.from_env()
-        if os.getenv("QAGENTIC_API_URL"):
-            config.api.url = env_config.api.url
-        if os.getenv("QAGENTIC_API_KEY"):
-            config.api.key = env_config.api.key
-        
         return config
     
+    @staticmethod
+    def _peek_header(path: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Read the scalar entries of a config file's ``project`` section.
+        
+        Only the YAML event stream is walked (no objects are constructed), and
+        it stops as soon as the ``project`` mapping closes, so the rest of the
+        file is never parsed. An alias or ``<<`` merge key seen before then
+        could change the section, so the file is fully loaded instead.
+        
+        Args:
+            path: Path to a YAML config file
+        
+        Returns:
+            Values such as ``{"name": ..., "environment": ...}`` (raw strings
+            when peeked); empty if the file has no project section or cannot
+            be read
+        """
+        from yaml import YAMLError, parse
+        from yaml.events import (
+            AliasEvent,
+            CollectionEndEvent,
+            CollectionStartEvent,
+            MappingStartEvent,
+            ScalarEvent,
+        )
+        
+        header: Dict[str, str] = {}
+        # One entry per open collection: pending key for mappings, or False
+        # for sequences. None means the mapping's next node is a key.
+        pending: List[Any] = []
+        try:
+            with open(path, "rb") as f:
+                for event in parse(f, Loader=_yaml_loader()):
+                    if isinstance(event, AliasEvent):
+                        return _load_project_section(path)
+                    if isinstance(event, ScalarEvent):
+                        if not pending or pending[-1] is False:
+                            continue
+                        if pending[-1] is None:
+                            if event.value == "<<":
+                                return _load_project_section(path)
+                            pending[-1] = event.value
+                            continue
+                        if len(pending) == 2 and pending[0] == "project":
+                            header[pending[-1]] = event.value
+                        pending[-1] = None
+                    elif isinstance(event, CollectionStartEvent):
+                        pending.append(None if isinstance(event, MappingStartEvent) else False)
+                    elif isinstance(event, CollectionEndEvent):
+                        pending.pop()
+                        if pending and pending[-1] is not False:
+                            if len(pending) == 1 and pending[0] == "project":
+                                break
+                            pending[-1] = None
+        except (OSError, YAMLError):
+            return {}
+        return header
+    
     @classmethod
-    def auto_discover(cls) -> "QAgenticConfig":
-        """Auto-discover configuration from common locations."""
-        search_paths = [
-            Path.cwd() / "qagentic.yaml",
-            Path.cwd() / "qagentic.yml",
-            Path.cwd() / ".qagentic.yaml",
-            Path.cwd() / ".qagentic.yml",
-            Path.home() / ".qagentic" / "config.yaml",
-        ]
+    def auto_discover(cls, project_name: Optional[str] = None) -> "QAgenticConfig":
+        """
+        Auto-discover configuration from common locations.
+        
+        Args:
+            project_name: Only use config files whose ``project.name`` matches
+                (e.g. to pick one project's file in a monorepo). Candidates
+                are checked by peeking at their ``project`` section only.
         
-        for path in search_paths:
-            if path.exists():
-                return cls.from_file(path)
+        Returns:
+            Configuration from the first matching file, or from the environment
+        """
+        key = (os.getcwd(), project_name)
+        try:
+            path = _DISCOVERED[key]
+        except KeyError:
+            path = _DISCOVERED[key] = _discover_path(*key)
+        
+        if path is not None:
+            return cls.from_file(path)
         
         return cls.from_env()
 
 
+def _yaml_loader() -> Any:
+    """
+    Return the YAML loader class used for config files.
+    
+    The libyaml-backed CSafeLoader (~10x faster) is preferred when PyYAML was
+    built with it. Set QAGENTIC_YAML_PURE=1 to force the pure-Python SafeLoader.
+    """
+    if not _env_bool(os.environ.get("QAGENTIC_YAML_PURE", "")):
+        try:
+            from yaml import CSafeLoader
+            return CSafeLoader
+        except ImportError:
+            pass
+    from yaml import SafeLoader
+    return SafeLoader
+
+
+def _load_project_section(path: Union[str, Path]) -> Dict[str, Any]:
+    """Fully load a config file and return its ``project`` mapping."""
+    from yaml import YAMLError, load
+    
+    try:
+        with open(path, "rb") as f:
+            data = load(f, Loader=_yaml_loader())
+    except (OSError, YAMLError):
+        return {}
+    project = data.get("project") if isinstance(data, dict) else None
+    return project if isinstance(project, dict) else {}
+
+
+# Config file names looked up in the working directory, in priority order.
+_CONFIG_NAMES = ("qagentic.yaml", "qagentic.yml", ".qagentic.yaml", ".qagentic.yml")
+
+
+def _discover_path(cwd: str, project_name: Optional[str] = None) -> Optional[Path]:
+    """Find the config file for a working directory, falling back to ~/.qagentic."""
+    # One directory listing instead of a stat per candidate name.
+    try:
+        with os.scandir(cwd) as entries:
+            names = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        names = set()
+    
+    def matches(path: Path) -> bool:
+        return project_name is None or QAgenticConfig._peek_header(path).get("name") == project_name
+    
+    for name in _CONFIG_NAMES:
+        if name in names and matches(Path(cwd) / name):
+            return Path(cwd) / name
+    
+    home_config = Path.home() / ".qagentic" / "config.yaml"
+    if home_config.is_file() and matches(home_config):
+        return home_config
+    return None
+
+
+# Discovered config path (or None) per (working directory, project filter). Only
+# the location is cached; from_file still re-parses the file when it changes.
+_DISCOVERED: Dict[Tuple[str, Optional[str]], Optional[Path]] = {}
+
+# Parsed config files keyed by (resolved path, mtime_ns, size); a changed file
+# gets a new key. Least recently used entries are evicted past the size cap.
+_PARSED_CACHE_SIZE = 16
+_PARSED_CACHE: "OrderedDict[Tuple[str, int, int], QAgenticConfig]" = OrderedDict()
+
+# Field names accepted as configure(**kwargs) overrides.
+_FEATURES_FIELDS = frozenset(f.name for f in fields(FeaturesConfig))
+_LABELS_FIELDS = frozenset(f.name for f in fields(LabelsConfig))
+
 # Global configuration instance
 _config: Optional[QAgenticConfig] = None
 
@@ -237,6 +419,7 @@ def configure(
     api_url: Optional[str] = None,
     api_key: Optional[str] = None,
     output_dir: Optional[str] = None,
+    reload: bool = False,
     **kwargs: Any,
 ) -> QAgenticConfig:
     """
@@ -248,6 +431,8 @@ def configure(
         api_url: URL of the QAagentic API
         api_key: API key for authentication
         output_dir: Directory for local reports
+        reload: Re-read config files and environment variables instead of
+            updating the current configuration in place
         **kwargs: Additional configuration options
     
     Returns:
@@ -262,7 +447,8 @@ def configure(
     """
     global _config
     
-    _config = QAgenticConfig.auto_discover()
+    if _config is None or reload:
+        _config = QAgenticConfig.auto_discover()
     
     if project_name:
         _config.project_name = project_name
@@ -277,9 +463,9 @@ def configure(
     
     # Handle additional kwargs
     for key, value in kwargs.items():
-        if hasattr(_config.features, key):
+        if key in _FEATURES_FIELDS:
             setattr(_config.features, key, value)
-        elif hasattr(_config.labels, key):
+        elif key in _LABELS_FIELDS:
             setattr(_config.labels, key, value)
     
     return _config
@@ -291,3 +477,21 @@ def get_config() -> QAgenticConfig:
     if _config is None:
         _config = QAgenticConfig.auto_discover()
     return _config
+
+
+def reset_config() -> None:
+    """
+    Drop the active configuration and all discovery/parse caches.
+    
+    The next get_config() or configure() call re-discovers config files and
+    re-reads the environment. Useful in tests, or after creating a config
+    file in a directory that was already searched.
+    
+    Example:
+        >>> qagentic.reset_config()
+        >>> qagentic.get_config()  # fresh discovery
+    """
+    global _config
+    _config = None
+    _DISCOVERED.clear()
+    _PARSED_CACHE.clear()
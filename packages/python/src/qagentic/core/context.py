@@ -10,30 +10,34 @@ Usage:
         s.attach_screenshot("dashboard.png")
 """
 
+import os
 import time
 import traceback
 from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Callable, Generator, List, Optional, TYPE_CHECKING
-from uuid import uuid4
 
-from qagentic.core.status import Status
+from qagentic.core.compat import DATACLASS_SLOTS
+from qagentic.core.serialization import dumps
+from qagentic.core.status import Status, _STATUS_STR
 
 if TYPE_CHECKING:
     from qagentic.core.test_result import StepResult
 
 
-# Thread-local storage for current step context
-import threading
-_step_context = threading.local()
+# Step stack for the current thread or asyncio task.
+_STEPS: ContextVar[Optional[List["Step"]]] = ContextVar("_qagentic_steps", default=None)
 
 
 def _get_current_steps() -> List["Step"]:
     """Get the current step stack."""
-    if not hasattr(_step_context, "steps"):
-        _step_context.steps = []
-    return _step_context.steps
+    steps = _STEPS.get()
+    if steps is None:
+        steps = []
+        _STEPS.set(steps)
+    return steps
 
 
 def _get_current_step() -> Optional["Step"]:
@@ -42,6 +46,61 @@ def _get_current_step() -> Optional["Step"]:
     return steps[-1] if steps else None
 
 
+@dataclass(**DATACLASS_SLOTS)
+class Attachment:
+    """Data attached to a step via Step.attach()."""
+    
+    name: str
+    type: str
+    data: Any
+    timestamp_ns: int  # time.time_ns(); formatted only when serialized
+    
+    @property
+    def timestamp(self) -> str:
+        """ISO 8601 UTC timestamp of when the data was attached."""
+        seconds, ns = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds, timezone.utc).replace(
+            microsecond=ns // 1000
+        ).isoformat()
+    
+    def __getitem__(self, key: str) -> Any:
+        """Dict-style access, for code written against the old dict attachments."""
+        return getattr(self, key)
+    
+    def to_dict(self) -> dict:
+        """Convert attachment to dictionary."""
+        return {
+            "name": self.name,
+            "type": self.type,
+            "data": self.data,
+            "timestamp": self.timestamp,
+        }
+
+
+class _ErrorTrace:
+    """
+    Descriptor for Step.error_trace.
+    
+    A failure captured by Step.__exit__ is kept as a TracebackException and
+    only formatted on first read. Both values live in the instance __dict__
+    (``_exc`` and ``_error_trace``), so neither shows up as a dataclass field.
+    """
+    
+    def __get__(self, obj: Any, objtype: Any = None) -> Optional[str]:
+        if obj is None:
+            return None  # Field default seen by @dataclass
+        state = obj.__dict__
+        exc = state.pop("_exc", None)
+        if exc is not None:
+            state["_error_trace"] = "".join(exc.format())
+        return state.get("_error_trace")
+    
+    def __set__(self, obj: Any, value: Optional[str]) -> None:
+        state = obj.__dict__
+        state.pop("_exc", None)
+        state["_error_trace"] = value
+
+
 @dataclass
 class Step:
     """
@@ -57,23 +116,27 @@ class Step:
     end_time: Optional[datetime] = None
     duration_ms: float = 0
     error: Optional[str] = None
-    error_trace: Optional[str] = None
-    attachments: List[dict] = field(default_factory=list)
+    error_trace: _ErrorTrace = _ErrorTrace()
+    attachments: List[Any] = field(default_factory=list)  # Attachment or attach() dicts
     children: List["Step"] = field(default_factory=list)
     parameters: dict = field(default_factory=dict)
-    _id: str = field(default_factory=lambda: str(uuid4()))
+    # 128 random bits as hex, like the attachment ids; skips the UUID object.
+    _id: str = field(default_factory=lambda: os.urandom(16).hex())
+    _start_ns: int = field(default=0, init=False, repr=False, compare=False)
     
     def __enter__(self) -> "Step":
         """Enter the step context."""
         self.start_time = datetime.now(timezone.utc)
+        self._start_ns = time.perf_counter_ns()
         self.status = Status.RUNNING
         _get_current_steps().append(self)
         return self
     
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> bool:
         """Exit the step context."""
+        # Monotonic clock for the duration; wall-clock times are for display only.
+        self.duration_ms = (time.perf_counter_ns() - self._start_ns) / 1_000_000
         self.end_time = datetime.now(timezone.utc)
-        self.duration_ms = (self.end_time - self.start_time).total_seconds() * 1000
         
         steps = _get_current_steps()
         if steps and steps[-1] is self:
@@ -87,7 +150,10 @@ class Step:
         if exc_type is not None:
             self.status = Status.FAILED
             self.error = str(exc_val)
-            self.error_trace = "".join(traceback.format_exception(exc_type, exc_val, exc_tb))
+            # Source lines are only read if the trace is actually formatted.
+            self.__dict__["_exc"] = traceback.TracebackException(
+                exc_type, exc_val, exc_tb, lookup_lines=False
+            )
             return False  # Re-raise the exception
         
         self.status = Status.PASSED
@@ -110,12 +176,7 @@ class Step:
         Returns:
             Self for chaining
         """
-        self.attachments.append({
-            "name": name,
-            "type": attachment_type,
-            "data": data,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        })
+        self.attachments.append(Attachment(name, attachment_type, data, time.time_ns()))
         return self
     
     def attach_screenshot(self, path: str, name: str = "Screenshot") -> "Step":
@@ -124,8 +185,7 @@ class Step:
     
     def attach_json(self, data: dict, name: str = "JSON Data") -> "Step":
         """Attach JSON data to this step."""
-        import json
-        return self.attach(json.dumps(data, indent=2), name, "application/json")
+        return self.attach(dumps(data, indent=2).decode("utf-8"), name, "application/json")
     
     def attach_text(self, text: str, name: str = "Text") -> "Step":
         """Attach text to this step."""
@@ -136,20 +196,27 @@ class Step:
         self.parameters[name] = value
         return self
     
-    def to_dict(self) -> dict:
-        """Convert step to dictionary."""
+    def to_dict(self, include_trace: bool = True) -> dict:
+        """
+        Convert step to dictionary.
+        
+        Args:
+            include_trace: Format and include error traces (skip for summaries)
+        """
+        # Local import: attachments imports this module at load time.
+        from qagentic.core.attachments import _serialize_attachment
         return {
             "id": self._id,
             "name": self.name,
             "description": self.description,
-            "status": str(self.status),
+            "status": _STATUS_STR.get(self.status, self.status),
             "start_time": self.start_time.isoformat() if self.start_time else None,
             "end_time": self.end_time.isoformat() if self.end_time else None,
             "duration_ms": self.duration_ms,
             "error": self.error,
-            "error_trace": self.error_trace,
-            "attachments": self.attachments,
-            "children": [child.to_dict() for child in self.children],
+            "error_trace": self.error_trace if include_trace else None,
+            "attachments": [_serialize_attachment(a) for a in self.attachments],
+            "children": [child.to_dict(include_trace) for child in self.children],
             "parameters": self.parameters,
         }
 
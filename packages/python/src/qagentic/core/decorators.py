@@ -13,9 +13,10 @@ Usage:
 """
 
 import functools
-from typing import Any, Callable, Optional, TypeVar, Union
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, TypeVar, Union
 
-from qagentic.core.severity import Severity
+from qagentic.core.severity import Severity, _SEVERITY_STR
 
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -23,25 +24,56 @@ F = TypeVar("F", bound=Callable[..., Any])
 QAGENTIC_MARKER = "_qagentic_metadata"
 
 
+# Returned by get_test_metadata for undecorated tests; read-only so it can be shared.
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({
+    "labels": MappingProxyType({}),
+    "links": (),
+    "attachments": (),
+    "steps": (),
+})
+
+
+def _new_metadata() -> dict:
+    return {
+        "labels": {},
+        "links": [],
+        "attachments": [],
+        "steps": [],
+    }
+
+
 def _get_metadata(func: Callable[..., Any]) -> dict:
     """Get or create metadata dictionary for a function."""
-    if not hasattr(func, QAGENTIC_MARKER):
-        setattr(func, QAGENTIC_MARKER, {
-            "labels": {},
-            "links": [],
-            "attachments": [],
-            "steps": [],
-        })
-    return getattr(func, QAGENTIC_MARKER)
+    try:
+        namespace = func.__dict__
+        meta = namespace.get(QAGENTIC_MARKER)
+        if meta is None:
+            # Built only for the first decorator applied to this function.
+            meta = namespace[QAGENTIC_MARKER] = _new_metadata()
+        return meta
+    except (AttributeError, TypeError):
+        # Classes (mappingproxy __dict__) and objects without a __dict__
+        if not hasattr(func, QAGENTIC_MARKER):
+            setattr(func, QAGENTIC_MARKER, _new_metadata())
+        return getattr(func, QAGENTIC_MARKER)
+
+
+class _LabelDecorator:
+    """Decorator that adds a label to the test (one small object, no closures)."""
+    
+    __slots__ = ("name", "value")
+    
+    def __init__(self, name: str, value: Any) -> None:
+        self.name = name
+        self.value = value
+    
+    def __call__(self, func: F) -> F:
+        _get_metadata(func)["labels"][self.name] = self.value
+        return func
 
 
-def _add_label(name: str, value: str) -> Callable[[F], F]:
-    """Create a decorator that adds a label to the test."""
-    def decorator(func: F) -> F:
-        metadata = _get_metadata(func)
-        metadata["labels"][name] = value
-        return func
-    return decorator
+# Create a decorator that adds a label to the test.
+_add_label = _LabelDecorator
 
 
 def feature(name: str) -> Callable[[F], F]:
@@ -103,7 +135,7 @@ def severity(level: Union[Severity, str]) -> Callable[[F], F]:
     """
     if isinstance(level, str):
         level = Severity.from_string(level)
-    return _add_label("severity", str(level))
+    return _add_label("severity", _SEVERITY_STR[level])
 
 
 def tag(*tags: str) -> Callable[[F], F]:
@@ -358,7 +390,7 @@ def automated() -> Callable[[F], F]:
     return _add_label("automated", "true")
 
 
-def get_test_metadata(func: Callable[..., Any]) -> dict:
+def get_test_metadata(func: Callable[..., Any]) -> Mapping[str, Any]:
     """
     Get all metadata for a test function.
     
@@ -366,11 +398,7 @@ def get_test_metadata(func: Callable[..., Any]) -> dict:
         func: Test function
     
     Returns:
-        Dictionary containing all test metadata
+        Mapping containing all test metadata (a shared read-only mapping
+        for undecorated functions; copy before modifying)
     """
-    return getattr(func, QAGENTIC_MARKER, {
-        "labels": {},
-        "links": [],
-        "attachments": [],
-        "steps": [],
-    })
+    return getattr(func, QAGENTIC_MARKER, _EMPTY_METADATA)
@@ -2,22 +2,96 @@
 Reporter classes for outputting test results to various destinations.
 """
 
-import json
+import atexit
+import io
 import os
+import queue
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 import threading
 
 from qagentic.core.config import get_config, QAgenticConfig
+from qagentic.core.serialization import dumps
 from qagentic.core.test_result import TestResult, TestRunResult
-from qagentic.core.status import Status
+from qagentic.core.status import Status, _STATUS_STR
 
 if TYPE_CHECKING:
     pass
 
 
+# Per-status console symbol and color
+_STATUS_SYMBOLS = {
+    Status.PASSED: ("✓", "green"),
+    Status.FAILED: ("✗", "red"),
+    Status.BROKEN: ("!", "yellow"),
+    Status.SKIPPED: ("○", "blue"),
+}
+_UNKNOWN_SYMBOL = ("?", "white")
+
+# Line prefixes for ConsoleReporter.report_test, built once per status
+_RICH_PREFIX = {
+    status: f"  [{color}]{symbol}[/{color}] "
+    for status, (symbol, color) in _STATUS_SYMBOLS.items()
+}
+_RICH_UNKNOWN = "  [{1}]{0}[/{1}] ".format(*_UNKNOWN_SYMBOL)
+_PLAIN_PREFIX = {status: f"  {symbol} " for status, (symbol, _) in _STATUS_SYMBOLS.items()}
+_PLAIN_UNKNOWN = f"  {_UNKNOWN_SYMBOL[0]} "
+
+
+# HTTP clients shared across runs, keyed by (base_url, timeout, headers), so
+# later runs reuse pooled keep-alive connections instead of reconnecting.
+_CLIENTS: Dict[Tuple[str, float, Tuple[Tuple[str, str], ...]], Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _shared_client(base_url: str, timeout: float, headers: Tuple[Tuple[str, str], ...]) -> Any:
+    """Return the pooled httpx.Client for these settings, creating it once."""
+    key = (base_url, timeout, headers)
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            import httpx
+            try:
+                import h2  # noqa: F401  (installed via httpx[http2])
+                http2 = True
+            except ImportError:
+                http2 = False
+            if not _CLIENTS:
+                atexit.register(_close_clients)
+            client = _CLIENTS[key] = httpx.Client(
+                base_url=base_url,
+                timeout=timeout,
+                headers=dict(headers),
+                http2=http2,
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+        return client
+
+
+def _close_clients() -> None:
+    """Close all shared HTTP clients (registered with atexit)."""
+    with _CLIENTS_LOCK:
+        for client in _CLIENTS.values():
+            client.close()
+        _CLIENTS.clear()
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write a finished report with as few write() calls as the OS allows."""
+    # O_BINARY keeps Windows from translating newlines, like open(..., "wb").
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 class BaseReporter(ABC):
     """Base class for all reporters."""
     
@@ -50,18 +124,23 @@ class ConsoleReporter(BaseReporter):
                 from rich.table import Table
                 from rich.panel import Panel
                 self._console = Console()
+                # Bound once for start_run/end_run instead of re-importing there
+                self._Panel = Panel
+                self._Table = Table
                 self._rich_available = True
             except ImportError:
                 self._rich_available = False
                 self._use_rich = False
         else:
             self._rich_available = False
+        
+        # Chosen once so report_test doesn't re-check the output mode per test
+        self._print_test = self._print_test_rich if self._use_rich else self._print_test_plain
     
     def start_run(self, run: TestRunResult) -> None:
         """Print run start banner."""
         if self._use_rich and self._rich_available:
-            from rich.panel import Panel
-            self._console.print(Panel(
+            self._console.print(self._Panel(
                 f"[bold blue]QAagentic Test Run[/bold blue]\n"
                 f"Project: {run.project_name}\n"
                 f"Environment: {run.environment}",
@@ -77,10 +156,7 @@ class ConsoleReporter(BaseReporter):
     def end_run(self, run: TestRunResult) -> None:
         """Print run summary."""
         if self._use_rich and self._rich_available:
-            from rich.table import Table
-            from rich.panel import Panel
-            
-            table = Table(show_header=True, header_style="bold")
+            table = self._Table(show_header=True, header_style="bold")
             table.add_column("Status", style="bold")
             table.add_column("Count", justify="right")
             
@@ -93,7 +169,7 @@ class ConsoleReporter(BaseReporter):
             status_color = "green" if run.is_successful else "red"
             status_icon = "✅" if run.is_successful else "❌"
             
-            self._console.print(Panel(
+            self._console.print(self._Panel(
                 table,
                 title=f"{status_icon} Test Run Complete - {run.pass_rate:.1f}% Pass Rate",
                 border_style=status_color,
@@ -106,26 +182,21 @@ class ConsoleReporter(BaseReporter):
     
     def report_test(self, test: TestResult) -> None:
         """Print test result."""
-        if not self.config.features.console_output:
-            return
-        
-        status_symbols = {
-            Status.PASSED: ("✓", "green"),
-            Status.FAILED: ("✗", "red"),
-            Status.BROKEN: ("!", "yellow"),
-            Status.SKIPPED: ("○", "blue"),
-        }
-        
-        symbol, color = status_symbols.get(test.status, ("?", "white"))
-        
-        if self._use_rich and self._rich_available:
-            self._console.print(f"  [{color}]{symbol}[/{color}] {test.name}")
-            if test.error_message:
-                self._console.print(f"    [dim red]{test.error_message[:100]}...[/dim red]")
-        else:
-            print(f"  {symbol} {test.name}")
-            if test.error_message:
-                print(f"    Error: {test.error_message[:100]}...")
+        if self.config.features.console_output:
+            self._print_test(test)
+    
+    def _print_test_rich(self, test: TestResult) -> None:
+        """Print a test result line with rich markup."""
+        console_print = self._console.print
+        console_print(_RICH_PREFIX.get(test.status, _RICH_UNKNOWN) + test.name)
+        if test.error_message:
+            console_print(f"    [dim red]{test.error_message[:100]}...[/dim red]")
+    
+    def _print_test_plain(self, test: TestResult) -> None:
+        """Print a plain-text test result line."""
+        print(_PLAIN_PREFIX.get(test.status, _PLAIN_UNKNOWN) + test.name)
+        if test.error_message:
+            print(f"    Error: {test.error_message[:100]}...")
 
 
 class JSONReporter(BaseReporter):
@@ -134,44 +205,53 @@ class JSONReporter(BaseReporter):
     def __init__(self, config: Optional[QAgenticConfig] = None) -> None:
         self.config = config or get_config()
         self.output_dir = Path(self.config.local.output_dir)
-        self._tests: List[dict] = []
         self._run: Optional[TestRunResult] = None
     
     def start_run(self, run: TestRunResult) -> None:
         """Initialize for new run."""
         self._run = run
-        self._tests = []
         
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         # Clean previous results if configured
         if self.config.local.clean_on_start:
-            for f in self.output_dir.glob("*.json"):
-                f.unlink()
+            # scandir reuses the directory listing's file type instead of
+            # building and stat()ing a Path per entry like glob() does.
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        os.unlink(entry.path)
     
     def end_run(self, run: TestRunResult) -> None:
         """Write final JSON report."""
-        if not self.config.local.enabled or "json" not in self.config.local.formats:
-            return
-        
-        # Write run summary
-        run_file = self.output_dir / "run.json"
-        with open(run_file, "w") as f:
-            json.dump(run.to_dict(), f, indent=2, default=str)
-        
-        # Write individual test results
-        tests_dir = self.output_dir / "tests"
-        tests_dir.mkdir(exist_ok=True)
+        # Run summary without the "tests" array, minus its closing "\n}"
+        run_chunks = [dumps(run.to_dict(include_tests=False), indent=2, default=str)[:-2]]
+        # Individual test results go one JSON object per line into a single
+        # file rather than one file per test.
+        test_lines = []
         
+        # Each test is converted to a dict once, encoded for both files and
+        # dropped, so the whole run is never held as nested dicts.
+        # Re-indenting a fragment is a plain newline replace since encoded
+        # JSON strings cannot contain raw newlines.
+        separator = b',\n  "tests": [\n    '
         for test in run.tests:
-            test_file = tests_dir / f"{test.id}.json"
-            with open(test_file, "w") as f:
-                json.dump(test.to_dict(), f, indent=2, default=str)
+            test_dict = test.to_dict()
+            run_chunks.append(separator)
+            run_chunks.append(dumps(test_dict, indent=2, default=str).replace(b"\n", b"\n    "))
+            test_lines.append(dumps(test_dict, default=str))
+            separator = b",\n    "
+        run_chunks.append(b"\n  ]\n}" if run.tests else b',\n  "tests": []\n}')
+        
+        # Each file is written with a single large write
+        _write_bytes(self.output_dir / "run.json", b"".join(run_chunks))
+        test_lines.append(b"")
+        _write_bytes(self.output_dir / "tests.ndjson", b"\n".join(test_lines))
     
     def report_test(self, test: TestResult) -> None:
-        """Add test to collection."""
-        self._tests.append(test.to_dict())
+        """No-op for JSON - everything is written from the run at end_run."""
+        pass
 
 
 class JUnitReporter(BaseReporter):
@@ -189,50 +269,59 @@ class JUnitReporter(BaseReporter):
     
     def end_run(self, run: TestRunResult) -> None:
         """Write JUnit XML report."""
-        if not self.config.local.enabled or "junit" not in self.config.local.formats:
-            return
+        from xml.sax.saxutils import XMLGenerator
         
-        import xml.etree.ElementTree as ET
-        
-        # Create testsuite element
-        testsuite = ET.Element("testsuite")
-        testsuite.set("name", run.project_name)
-        testsuite.set("tests", str(run.total))
-        testsuite.set("failures", str(run.failed))
-        testsuite.set("errors", str(run.broken))
-        testsuite.set("skipped", str(run.skipped))
-        testsuite.set("time", str(run.duration_ms / 1000))
-        testsuite.set("timestamp", run.start_time.isoformat() if run.start_time else "")
-        
-        for test in run.tests:
-            testcase = ET.SubElement(testsuite, "testcase")
-            testcase.set("name", test.name)
-            testcase.set("classname", test.class_name or test.module or "")
-            testcase.set("time", str(test.duration_ms / 1000))
-            
-            if test.status == Status.FAILED:
-                failure = ET.SubElement(testcase, "failure")
-                failure.set("message", test.error_message or "Test failed")
-                failure.set("type", test.error_type or "AssertionError")
-                if test.stack_trace:
-                    failure.text = test.stack_trace
+        # Stream elements into a buffer instead of building an ElementTree
+        # for the whole run first, then write the file in one go.
+        with io.BytesIO() as f:
+            xml = XMLGenerator(f, encoding="utf-8", short_empty_elements=True)
+            xml.startDocument()
+            xml.startElement("testsuite", {
+                "name": run.project_name,
+                "tests": str(run.total),
+                "failures": str(run.failed),
+                "errors": str(run.broken),
+                "skipped": str(run.skipped),
+                "time": str(run.duration_ms / 1000),
+                "timestamp": run.start_time.isoformat() if run.start_time else "",
+            })
             
-            elif test.status == Status.BROKEN:
-                error = ET.SubElement(testcase, "error")
-                error.set("message", test.error_message or "Test error")
-                error.set("type", test.error_type or "Error")
-                if test.stack_trace:
-                    error.text = test.stack_trace
+            for test in run.tests:
+                xml.startElement("testcase", {
+                    "name": test.name,
+                    "classname": test.class_name or test.module or "",
+                    "time": str(test.duration_ms / 1000),
+                })
+                
+                if test.status == Status.FAILED:
+                    self._write_outcome(xml, "failure", {
+                        "message": test.error_message or "Test failed",
+                        "type": test.error_type or "AssertionError",
+                    }, test.stack_trace)
+                
+                elif test.status == Status.BROKEN:
+                    self._write_outcome(xml, "error", {
+                        "message": test.error_message or "Test error",
+                        "type": test.error_type or "Error",
+                    }, test.stack_trace)
+                
+                elif test.status == Status.SKIPPED:
+                    attrs = {"message": test.error_message} if test.error_message else {}
+                    self._write_outcome(xml, "skipped", attrs, None)
+                
+                xml.endElement("testcase")
             
-            elif test.status == Status.SKIPPED:
-                skipped = ET.SubElement(testcase, "skipped")
-                if test.error_message:
-                    skipped.set("message", test.error_message)
-        
-        # Write to file
-        tree = ET.ElementTree(testsuite)
-        junit_file = self.output_dir / "junit.xml"
-        tree.write(junit_file, encoding="unicode", xml_declaration=True)
+            xml.endElement("testsuite")
+            xml.endDocument()
+            _write_bytes(self.output_dir / "junit.xml", f.getvalue())
+    
+    @staticmethod
+    def _write_outcome(xml: Any, tag: str, attrs: Dict[str, str], text: Optional[str]) -> None:
+        """Write a <failure>/<error>/<skipped> child element."""
+        xml.startElement(tag, attrs)
+        if text:
+            xml.characters(text)
+        xml.endElement(tag)
     
     def report_test(self, test: TestResult) -> None:
         """No-op for JUnit - all written at end."""
@@ -242,39 +331,48 @@ class JUnitReporter(BaseReporter):
 class APIReporter(BaseReporter):
     """Reporter that sends results to QAagentic API."""
     
+    # Seconds without new results before a partial batch is uploaded
+    _FLUSH_INTERVAL = 0.2
+    
     def __init__(self, config: Optional[QAgenticConfig] = None) -> None:
         self.config = config or get_config()
         self._client: Optional[Any] = None
         self._run: Optional[TestRunResult] = None
-        self._batch: List[TestResult] = []
+        # Results are encoded once when batched; flushes only join and send bytes.
+        self._batch: List[bytes] = []
+        self._bulk_supported = True
+        # Background uploader, started per run so tests never wait on the network.
+        self._queue: "Optional[queue.Queue[Optional[bytes]]]" = None
+        self._worker: Optional[threading.Thread] = None
     
     def _get_client(self) -> Any:
-        """Get or create HTTP client."""
+        """
+        Get or create HTTP client.
+        
+        Request bodies are pre-encoded with dumps() and sent as content=, so
+        the Content-Type header below must stay application/json.
+        """
         if self._client is None:
-            import httpx
-            self._client = httpx.Client(
-                base_url=self.config.api.url,
-                timeout=self.config.api.timeout,
-                headers={
-                    "Content-Type": "application/json",
-                    "X-API-Key": self.config.api.key or "",
-                    "X-Project": self.config.project_name,
-                },
+            self._client = _shared_client(
+                self.config.api.url,
+                self.config.api.timeout,
+                (
+                    ("Content-Type", "application/json"),
+                    ("X-API-Key", self.config.api.key or ""),
+                    ("X-Project", self.config.project_name),
+                ),
             )
         return self._client
     
     def start_run(self, run: TestRunResult) -> None:
         """Register run with API."""
-        if not self.config.api.enabled:
-            return
-        
         self._run = run
         self._batch = []
         
         try:
             client = self._get_client()
             # Use correct API Gateway endpoint with camelCase fields
-            response = client.post("/api/test-runs", json={
+            response = client.post("/api/test-runs", content=dumps({
                 "projectName": run.project_name,
                 "environment": run.environment,
                 "startTime": run.start_time.isoformat() if run.start_time else None,
@@ -283,7 +381,7 @@ class APIReporter(BaseReporter):
                     "platform": None,
                     "testFramework": "pytest"
                 }
-            })
+            }))
             response.raise_for_status()
             data = response.json()
             # Store the API-generated run ID
@@ -292,20 +390,31 @@ class APIReporter(BaseReporter):
             # Log but don't fail tests
             print(f"Warning: Failed to register run with API: {e}")
             self._api_run_id = run.id
+        
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(
+            target=self._upload_loop,
+            args=(self._queue,),
+            name="qagentic-api-reporter",
+            daemon=True,
+        )
+        self._worker.start()
     
     def end_run(self, run: TestRunResult) -> None:
         """Finalize run with API."""
-        if not self.config.api.enabled:
-            return
-        
-        # Flush any remaining batch
+        # Let the uploader send what is queued, then stop it
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._queue = None
+            self._worker = None
         self._flush_batch()
         
         try:
             client = self._get_client()
             # Use correct API Gateway endpoint with camelCase fields
             api_run_id = getattr(self, '_api_run_id', run.id)
-            response = client.patch(f"/api/test-runs/{api_run_id}", json={
+            response = client.patch(f"/api/test-runs/{api_run_id}", content=dumps({
                 "endTime": run.end_time.isoformat() if run.end_time else None,
                 "summary": {
                     "total": run.total,
@@ -315,25 +424,61 @@ class APIReporter(BaseReporter):
                     "skipped": run.skipped,
                     "duration_ms": run.duration_ms,
                 }
-            })
+            }))
             response.raise_for_status()
         except Exception as e:
             print(f"Warning: Failed to finalize run with API: {e}")
         finally:
-            if self._client:
-                self._client.close()
-                self._client = None
+            # The shared client stays open so the next run reuses its connections.
+            self._client = None
     
     def report_test(self, test: TestResult) -> None:
         """Add test to batch and flush if needed."""
-        if not self.config.api.enabled:
+        # Encoded here, on the caller's thread, so the uploader sends a
+        # snapshot rather than an object the test run may still modify.
+        payload = self._encode_result(test)
+        if self._queue is not None:
+            self._queue.put(payload)
             return
         
-        self._batch.append(test)
+        self._batch.append(payload)
         
         if len(self._batch) >= self.config.api.batch_size:
             self._flush_batch()
     
+    def _upload_loop(self, results: "queue.Queue[Optional[bytes]]") -> None:
+        """
+        Worker thread: batch queued (already encoded) results and upload them.
+        
+        A batch is sent when it reaches api.batch_size or when no new result
+        arrived for _FLUSH_INTERVAL seconds. A None item flushes and stops.
+        """
+        batch_size = self.config.api.batch_size
+        while True:
+            try:
+                payload = results.get(timeout=self._FLUSH_INTERVAL)
+            except queue.Empty:
+                self._flush_batch()
+                continue
+            if payload is None:
+                self._flush_batch()
+                return
+            self._batch.append(payload)
+            if len(self._batch) >= batch_size:
+                self._flush_batch()
+    
+    def _encode_result(self, test: TestResult) -> bytes:
+        """Encode the API payload for one test result."""
+        return dumps({
+            "runId": getattr(self, '_api_run_id', None),
+            "name": test.name,
+            "status": _STATUS_STR.get(test.status, test.status),
+            "duration": test.duration_ms,
+            "metadata": test.labels or {},
+            "error": test.error_message,
+            "stackTrace": test.stack_trace,
+        }, default=str)
+    
     def _flush_batch(self) -> None:
         """Send batch of tests to API."""
         if not self._batch or not self._run:
@@ -342,20 +487,25 @@ class APIReporter(BaseReporter):
         try:
             client = self._get_client()
             api_run_id = getattr(self, '_api_run_id', self._run.id)
-            # Send each test result individually
-            for test in self._batch:
+            
+            # One request for the whole batch when the API supports it; the
+            # body is spliced together from the already-encoded results.
+            if self._bulk_supported:
                 response = client.post(
-                    f"/api/test-runs/results",
-                    json={
-                        "runId": api_run_id,
-                        "name": test.name,
-                        "status": str(test.status),
-                        "duration": test.duration_ms,
-                        "metadata": test.labels or {},
-                        "error": test.error_message,
-                        "stackTrace": test.stack_trace,
-                    }
+                    "/api/test-runs/results/bulk",
+                    content=b"".join((
+                        b'{"runId":', dumps(api_run_id), b',"results":[',
+                        b",".join(self._batch), b"]}",
+                    )),
                 )
+                if response.status_code not in (404, 405):
+                    response.raise_for_status()
+                    return
+                # Older API without the bulk endpoint: post results one by one from now on.
+                self._bulk_supported = False
+            
+            for payload in self._batch:
+                response = client.post("/api/test-runs/results", content=payload)
                 response.raise_for_status()
         except Exception as e:
             print(f"Warning: Failed to send test results to API: {e}")
@@ -377,14 +527,18 @@ class QAgenticReporter:
         self.config = config or get_config()
         self._reporters: List[BaseReporter] = []
         self._current_run: Optional[TestRunResult] = None
+        self._start_ns = 0
         
-        # Initialize reporters based on config
+        # Initialize reporters based on config. Disabled outputs get no
+        # reporter at all, so the reporters themselves don't re-check.
         if self.config.features.console_output:
             self._reporters.append(ConsoleReporter(self.config))
         
         if self.config.local.enabled:
-            self._reporters.append(JSONReporter(self.config))
-            if "junit" in self.config.local.formats:
+            formats = self.config.local.formats
+            if "json" in formats:
+                self._reporters.append(JSONReporter(self.config))
+            if "junit" in formats:
                 self._reporters.append(JUnitReporter(self.config))
         
         if self.config.api.enabled:
@@ -393,6 +547,10 @@ class QAgenticReporter:
     @classmethod
     def get_instance(cls, config: Optional[QAgenticConfig] = None) -> "QAgenticReporter":
         """Get singleton instance."""
+        # Lock-free once created; the lock only guards first creation.
+        instance = cls._instance
+        if instance is not None:
+            return instance
         with cls._lock:
             if cls._instance is None:
                 cls._instance = cls(config)
@@ -420,6 +578,7 @@ class QAgenticReporter:
             labels=self.config.labels.custom.copy(),
             **kwargs,
         )
+        self._start_ns = time.perf_counter_ns()
         
         for reporter in self._reporters:
             reporter.start_run(self._current_run)
@@ -431,10 +590,9 @@ class QAgenticReporter:
         if not self._current_run:
             return None
         
+        # Monotonic clock for the duration, as in Step; end_time is for display.
+        self._current_run.duration_ms = (time.perf_counter_ns() - self._start_ns) / 1_000_000
         self._current_run.end_time = datetime.now(timezone.utc)
-        self._current_run.duration_ms = (
-            self._current_run.end_time - self._current_run.start_time
-        ).total_seconds() * 1000
         
         for reporter in self._reporters:
             reporter.end_run(self._current_run)
@@ -0,0 +1,41 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional: pip install qagentic-pytest[fast]
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(
+    obj: Any,
+    indent: Optional[int] = None,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    orjson is used when available and the requested layout is one it
+    supports (compact or 2-space indent). The standard library is used
+    otherwise, or when orjson rejects the payload (e.g. integers wider
+    than 64 bits), so the output is always valid JSON either way.
+
+    Args:
+        obj: Object to serialize
+        indent: Indentation level (None for compact output)
+        default: Fallback for objects that are not JSON serializable
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except TypeError:  # orjson.JSONEncodeError
+            pass
+    return json.dumps(obj, indent=indent, default=default).encode("utf-8")
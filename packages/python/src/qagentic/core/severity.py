@@ -1,6 +1,7 @@
 """Severity levels for test cases."""
 
 from enum import Enum
+from typing import Dict
 
 
 class Severity(str, Enum):
@@ -18,8 +19,11 @@ class Severity(str, Enum):
     @classmethod
     def from_string(cls, value: str) -> "Severity":
         """Convert string to Severity enum."""
-        value_lower = value.lower()
-        for severity in cls:
-            if severity.value == value_lower:
-                return severity
-        return cls.NORMAL
+        return _SEVERITY_BY_VALUE.get(value.lower(), cls.NORMAL)
+
+
+# Value -> member, used by Severity.from_string
+_SEVERITY_BY_VALUE: Dict[str, Severity] = {member.value: member for member in Severity}
+
+# Member -> serialized value; a dict hit is ~4x cheaper than str(member).
+_SEVERITY_STR: Dict[Severity, str] = {member: member.value for member in Severity}
@@ -2,16 +2,52 @@
 Test result models for storing and transmitting test execution data.
 """
 
+import os
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-from uuid import uuid4
 
-from qagentic.core.status import Status
+from qagentic.core.attachments import _serialize_attachment
+from qagentic.core.compat import DATACLASS_SLOTS
+from qagentic.core.status import Status, _STATUS_STR
 from qagentic.core.severity import Severity
 
 
-@dataclass
+# Random bytes for _fast_uuid, fetched in bulk: one os.urandom call per
+# 256 ids instead of one per id.
+_UUID_POOL_SIZE = 4096
+_uuid_pool = b""
+_uuid_offset = _UUID_POOL_SIZE
+_uuid_lock = threading.Lock()
+
+
+def _fast_uuid() -> str:
+    """Return a random (version 4) UUID string, like str(uuid4())."""
+    global _uuid_pool, _uuid_offset
+    with _uuid_lock:
+        offset = _uuid_offset
+        if offset >= _UUID_POOL_SIZE:
+            _uuid_pool = os.urandom(_UUID_POOL_SIZE)
+            offset = 0
+        _uuid_offset = offset + 16
+        h = _uuid_pool[offset:offset + 16].hex()
+    # Patch in the version nibble and the RFC 4122 variant bits
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{'89ab'[int(h[16], 16) & 3]}{h[17:20]}-{h[20:]}"
+
+
+def _reset_uuid_pool() -> None:
+    """Drop the pool in a forked child so it never repeats the parent's ids."""
+    global _uuid_offset, _uuid_lock
+    _uuid_offset = _UUID_POOL_SIZE
+    _uuid_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):  # POSIX only
+    os.register_at_fork(after_in_child=_reset_uuid_pool)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class StepResult:
     """Result of a single test step."""
     
@@ -30,24 +66,24 @@ class StepResult:
         """Convert to dictionary."""
         return {
             "name": self.name,
-            "status": str(self.status),
+            "status": _STATUS_STR.get(self.status, self.status),
             "start_time": self.start_time.isoformat() if self.start_time else None,
             "end_time": self.end_time.isoformat() if self.end_time else None,
             "duration_ms": self.duration_ms,
             "error": self.error,
             "error_trace": self.error_trace,
-            "attachments": self.attachments,
+            "attachments": [_serialize_attachment(a) for a in self.attachments],
             "children": [c.to_dict() for c in self.children],
             "parameters": self.parameters,
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TestResult:
     """Complete result of a test execution."""
     
     # Identification
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=_fast_uuid)
     name: str = ""
     full_name: str = ""
     description: Optional[str] = None
@@ -142,7 +178,7 @@ class TestResult:
             "name": self.name,
             "full_name": self.full_name,
             "description": self.description,
-            "status": str(self.status),
+            "status": _STATUS_STR.get(self.status, self.status),
             "start_time": self.start_time.isoformat() if self.start_time else None,
             "end_time": self.end_time.isoformat() if self.end_time else None,
             "duration_ms": self.duration_ms,
@@ -153,7 +189,7 @@ class TestResult:
             "links": self.links,
             "parameters": self.parameters,
             "steps": [s.to_dict() for s in self.steps],
-            "attachments": self.attachments,
+            "attachments": [_serialize_attachment(a) for a in self.attachments],
             "file_path": self.file_path,
             "line_number": self.line_number,
             "module": self.module,
@@ -168,7 +204,7 @@ class TestResult:
     def from_dict(cls, data: dict) -> "TestResult":
         """Create from dictionary."""
         result = cls(
-            id=data.get("id", str(uuid4())),
+            id=data["id"] if "id" in data else _fast_uuid(),
             name=data.get("name", ""),
             full_name=data.get("full_name", ""),
             description=data.get("description"),
@@ -201,11 +237,20 @@ class TestResult:
         return result
 
 
-@dataclass
+# Status -> TestRunResult counter attribute (plain "passed" etc. match too)
+_STATUS_COUNTER: Dict[Status, str] = {
+    Status.PASSED: "passed",
+    Status.FAILED: "failed",
+    Status.BROKEN: "broken",
+    Status.SKIPPED: "skipped",
+}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TestRunResult:
     """Result of a complete test run."""
     
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=_fast_uuid)
     name: str = ""
     project_name: str = ""
     environment: str = "local"
@@ -238,14 +283,9 @@ class TestRunResult:
         self.tests.append(test)
         self.total += 1
         
-        if test.status == Status.PASSED:
-            self.passed += 1
-        elif test.status == Status.FAILED:
-            self.failed += 1
-        elif test.status == Status.BROKEN:
-            self.broken += 1
-        elif test.status == Status.SKIPPED:
-            self.skipped += 1
+        counter = _STATUS_COUNTER.get(test.status)
+        if counter is not None:
+            setattr(self, counter, getattr(self, counter) + 1)
     
     @property
     def pass_rate(self) -> float:
@@ -259,9 +299,14 @@ class TestRunResult:
         """Check if the run was successful (no failures)."""
         return self.failed == 0 and self.broken == 0
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return {
+    def to_dict(self, include_tests: bool = True) -> dict:
+        """
+        Convert to dictionary.
+        
+        Args:
+            include_tests: Serialize every test under "tests" (omit the key if False)
+        """
+        data = {
             "id": self.id,
             "name": self.name,
             "project_name": self.project_name,
@@ -281,5 +326,7 @@ class TestRunResult:
             "ci_build_url": self.ci_build_url,
             "branch": self.branch,
             "commit_hash": self.commit_hash,
-            "tests": [t.to_dict() for t in self.tests],
         }
+        if include_tests:
+            data["tests"] = [t.to_dict() for t in self.tests]
+        return data
@@ -0,0 +1,320 @@
+"""
+Per-session pytest plugin that collects results and feeds the reporter.
+
+Imported by qagentic.pytest_plugin only once reporting is enabled, so plain
+pytest runs never load the reporting stack.
+"""
+
+import functools
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Generator, Mapping, Optional, Tuple
+
+import pytest
+from _pytest.nodes import Item
+from _pytest.reports import TestReport
+from _pytest.runner import CallInfo
+
+from qagentic.core.config import QAgenticConfig
+from qagentic.core.decorators import _EMPTY_METADATA, get_test_metadata
+from qagentic.core.reporter import QAgenticReporter
+from qagentic.core.status import Status
+from qagentic.core.test_result import TestResult, StepResult, _fast_uuid
+from qagentic.core.context import _STEPS
+from qagentic.core.attachments import _clear_attachments, _take_attachments
+
+
+# CI/CD providers as (sentinel variable, env -> run info), checked in order
+_CI_PROVIDERS: Tuple[Tuple[str, Callable[[Mapping[str, str]], Dict[str, Optional[str]]]], ...] = (
+    # GitHub Actions
+    ("GITHUB_ACTIONS", lambda env: {
+        "build_id": env.get("GITHUB_RUN_ID"),
+        "build_url": f"{env.get('GITHUB_SERVER_URL')}/{env.get('GITHUB_REPOSITORY')}/actions/runs/{env.get('GITHUB_RUN_ID')}",
+        "branch": env.get("GITHUB_REF_NAME"),
+        "commit": env.get("GITHUB_SHA"),
+    }),
+    # GitLab CI
+    ("GITLAB_CI", lambda env: {
+        "build_id": env.get("CI_PIPELINE_ID"),
+        "build_url": env.get("CI_PIPELINE_URL"),
+        "branch": env.get("CI_COMMIT_REF_NAME"),
+        "commit": env.get("CI_COMMIT_SHA"),
+    }),
+    # Jenkins
+    ("JENKINS_URL", lambda env: {
+        "build_id": env.get("BUILD_NUMBER"),
+        "build_url": env.get("BUILD_URL"),
+        "branch": env.get("GIT_BRANCH"),
+        "commit": env.get("GIT_COMMIT"),
+    }),
+    # Azure DevOps
+    ("TF_BUILD", lambda env: {
+        "build_id": env.get("BUILD_BUILDID"),
+        "build_url": f"{env.get('SYSTEM_TEAMFOUNDATIONSERVERURI')}{env.get('SYSTEM_TEAMPROJECT')}/_build/results?buildId={env.get('BUILD_BUILDID')}",
+        "branch": env.get("BUILD_SOURCEBRANCHNAME"),
+        "commit": env.get("BUILD_SOURCEVERSION"),
+    }),
+    # CircleCI
+    ("CIRCLECI", lambda env: {
+        "build_id": env.get("CIRCLE_BUILD_NUM"),
+        "build_url": env.get("CIRCLE_BUILD_URL"),
+        "branch": env.get("CIRCLE_BRANCH"),
+        "commit": env.get("CIRCLE_SHA1"),
+    }),
+    # Travis CI
+    ("TRAVIS", lambda env: {
+        "build_id": env.get("TRAVIS_BUILD_ID"),
+        "build_url": env.get("TRAVIS_BUILD_WEB_URL"),
+        "branch": env.get("TRAVIS_BRANCH"),
+        "commit": env.get("TRAVIS_COMMIT"),
+    }),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_ci() -> Dict[str, Optional[str]]:
+    """Detect the CI/CD provider once per process and return its run info."""
+    env = os.environ
+    for sentinel, info in _CI_PROVIDERS:
+        if env.get(sentinel):
+            return info(env)
+    return {}
+
+
+# Bound once for the per-test setup/teardown timestamps
+_UTC = timezone.utc
+_dt_now = datetime.now
+
+# getattr() default for optional report attributes that may legitimately be None
+_MISSING = object()
+
+# Markers that are pytest/plugin mechanics rather than test labels
+_SKIP_MARKERS = frozenset(("parametrize", "usefixtures", "qagentic"))
+
+# Each item's TestResult lives in the item's own stash, so hooks look it up
+# without hashing the (possibly long, parametrized) nodeid.
+_RESULT_KEY = pytest.StashKey[TestResult]()
+# perf_counter_ns() at setup, for a monotonic duration (TestResult has slots)
+_START_NS_KEY = pytest.StashKey[int]()
+
+
+class QAgenticPytestPlugin:
+    """Main pytest plugin for QAagentic reporting."""
+    
+    def __init__(self, config: QAgenticConfig, marked_only: bool = False) -> None:
+        self.config = config
+        self.reporter = QAgenticReporter(config)
+        # --qagentic-only: track just the tests marked @pytest.mark.qagentic
+        self._marked_only = marked_only
+        self._current_test: Optional[TestResult] = None
+    
+    def pytest_sessionstart(self, session: pytest.Session) -> None:
+        """Called when test session starts."""
+        # Get CI/CD information from environment
+        ci_info = self._get_ci_info()
+        
+        self.reporter.start_run(
+            name=f"pytest_{_dt_now(_UTC).strftime('%Y%m%d_%H%M%S')}",
+            project_name=self.config.project_name,
+            environment=self.config.environment,
+            ci_build_id=ci_info.get("build_id"),
+            ci_build_url=ci_info.get("build_url"),
+            branch=ci_info.get("branch"),
+            commit_hash=ci_info.get("commit"),
+        )
+    
+    def pytest_sessionfinish(self, session: pytest.Session, exitstatus: int) -> None:
+        """Called when test session ends."""
+        self.reporter.end_run()
+    
+    def pytest_runtest_setup(self, item: Item) -> None:
+        """Called before each test setup."""
+        # Untracked items get no result, so the later hooks return at once
+        if self._marked_only and item.get_closest_marker("qagentic") is None:
+            return
+        
+        # Drop anything attached outside a test since the last teardown, e.g.
+        # by fixture finalizers, which run after this plugin's teardown hook
+        _clear_attachments()
+        
+        # Create test result
+        test_result = self._create_test_result(item)
+        test_result.start_time = _dt_now(_UTC)
+        test_result.status = Status.RUNNING
+        
+        item.stash[_RESULT_KEY] = test_result
+        item.stash[_START_NS_KEY] = time.perf_counter_ns()
+        self._current_test = test_result
+    
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item: Item, call: CallInfo) -> Generator[None, Any, None]:
+        """Process test report for each phase (setup, call, teardown)."""
+        outcome = yield
+        
+        test_result = item.stash.get(_RESULT_KEY, None)
+        if test_result is None:
+            return
+        report: TestReport = outcome.get_result()
+        
+        handler = _PHASE_HANDLERS.get(report.when)
+        if handler is not None:
+            handler(self, test_result, report)
+    
+    def _on_setup_report(self, test_result: TestResult, report: TestReport) -> None:
+        """Mark the test broken if setup (e.g. a fixture) failed."""
+        if report.failed:
+            test_result.status = Status.BROKEN
+            test_result.error_message = str(report.longrepr)
+            test_result.error_type = "SetupError"
+            longreprtext = getattr(report, "longreprtext", _MISSING)
+            if longreprtext is not _MISSING:
+                test_result.stack_trace = longreprtext
+    
+    def _on_call_report(self, test_result: TestResult, report: TestReport) -> None:
+        """Record the outcome of the test body."""
+        if report.passed:
+            test_result.status = Status.PASSED
+        elif report.failed:
+            test_result.status = Status.FAILED
+            self._extract_error_info(test_result, report)
+        elif report.skipped:
+            test_result.status = Status.SKIPPED
+            wasxfail = getattr(report, "wasxfail", _MISSING)
+            if wasxfail is not _MISSING:
+                test_result.error_message = wasxfail
+    
+    def _on_teardown_report(self, test_result: TestResult, report: TestReport) -> None:
+        """Mark a passed test broken if its teardown failed, then report it."""
+        if report.failed and test_result.status == Status.PASSED:
+            test_result.status = Status.BROKEN
+            test_result.error_message = str(report.longrepr)
+            test_result.error_type = "TeardownError"
+        
+        # Reported only now: pytest builds the teardown report after the
+        # pytest_runtest_teardown hook, and the result is final only here
+        self.reporter.report_test(test_result)
+        self._current_test = None
+    
+    def pytest_runtest_teardown(self, item: Item) -> None:
+        """Collect timing, steps and attachments once the test has run."""
+        test_result = item.stash.get(_RESULT_KEY, None)
+        if test_result is None:
+            return
+        
+        # Monotonic clock for the duration, as for steps and runs; the
+        # datetimes are kept for display
+        test_result.duration_ms = (time.perf_counter_ns() - item.stash[_START_NS_KEY]) / 1_000_000
+        test_result.end_time = _dt_now(_UTC)
+        
+        # Collect steps from context; most tests have none, so peek at the
+        # context variable rather than creating an empty stack
+        steps = _STEPS.get()
+        if steps:
+            test_result.steps.extend(
+                StepResult(
+                    name=step.name,
+                    status=step.status,
+                    start_time=step.start_time,
+                    end_time=step.end_time,
+                    duration_ms=step.duration_ms,
+                    error=step.error,
+                    error_trace=step.error_trace,
+                    attachments=step.attachments,
+                    parameters=step.parameters,
+                )
+                for step in steps
+            )
+        
+        # Collect test-level attachments; the list itself is handed over
+        # rather than copied when nothing was attached via the fixture.
+        attachments = _take_attachments()
+        if attachments is not None:
+            if test_result.attachments:
+                test_result.attachments.extend(attachments)
+            else:
+                test_result.attachments = attachments
+    
+    def _create_test_result(self, item: Item) -> TestResult:
+        """Create a TestResult from a pytest Item."""
+        # Get test metadata from decorators
+        metadata = get_test_metadata(item.obj) if hasattr(item, "obj") else _EMPTY_METADATA
+        # Copy: marker labels are added below and must not leak into the
+        # function's own metadata (shared by every parametrized item). The
+        # copies are per test since the qagentic_test fixture may mutate them;
+        # only the lookup defaults are shared.
+        labels = dict(metadata.get("labels", _EMPTY_METADATA["labels"]))
+        links = list(metadata.get("links", ()))
+        
+        # Extract location info. item.location is pytest's cached reportinfo()
+        # (already computed for its own reporting), and item.path avoids the
+        # legacy py.path object that item.fspath builds on every access.
+        file_path = str(item.path) if item.path else None
+        line_number = item.location[1]
+        
+        # Get module and class names
+        module = item.module.__name__ if hasattr(item, "module") else None
+        class_name = item.cls.__name__ if hasattr(item, "cls") and item.cls else None
+        
+        # Get description from docstring
+        description = item.obj.__doc__ if hasattr(item, "obj") and item.obj.__doc__ else None
+        
+        # Get parameters for parametrized tests
+        parameters = dict(item.callspec.params) if hasattr(item, "callspec") else {}
+        
+        # Add pytest markers as labels
+        for marker in item.iter_markers():
+            name = marker.name
+            if name in _SKIP_MARKERS:
+                continue
+            args = marker.args
+            labels[name] = (args[0] if len(args) == 1 else list(args)) if args else True
+        
+        return TestResult(
+            id=_fast_uuid(),
+            name=item.name,
+            full_name=item.nodeid,
+            description=description,
+            labels=labels,
+            links=links,
+            parameters=parameters,
+            file_path=file_path,
+            line_number=line_number,
+            module=module,
+            class_name=class_name,
+        )
+    
+    def _extract_error_info(self, test_result: TestResult, report: TestReport) -> None:
+        """Extract error information from a failed test report."""
+        longrepr = getattr(report, "longrepr", _MISSING)
+        if longrepr is _MISSING:
+            return
+        
+        crash = getattr(longrepr, "reprcrash", _MISSING)
+        if crash is not _MISSING:
+            message = getattr(crash, "message", _MISSING)
+            test_result.error_message = str(crash) if message is _MISSING else message
+            test_result.error_type = type(crash).__name__ if crash else "AssertionError"
+        else:
+            test_result.error_message = str(longrepr)
+            test_result.error_type = "AssertionError"
+        
+        longreprtext = getattr(report, "longreprtext", _MISSING)
+        if longreprtext is not _MISSING:
+            test_result.stack_trace = longreprtext
+        else:
+            reprtraceback = getattr(longrepr, "reprtraceback", _MISSING)
+            if reprtraceback is not _MISSING:
+                test_result.stack_trace = str(reprtraceback)
+    
+    def _get_ci_info(self) -> Dict[str, Optional[str]]:
+        """Extract CI/CD information from environment."""
+        return _detect_ci()
+
+
+# report.when -> phase handler used by pytest_runtest_makereport
+_PHASE_HANDLERS: Dict[str, Callable[[QAgenticPytestPlugin, TestResult, TestReport], None]] = {
+    "setup": QAgenticPytestPlugin._on_setup_report,
+    "call": QAgenticPytestPlugin._on_call_report,
+    "teardown": QAgenticPytestPlugin._on_teardown_report,
+}